@@ -1,16 +1,84 @@
 import tkinter as tk
 from tkinter import messagebox, ttk
+from tkinter import font as tkfont
 import sqlite3
 import hashlib
+import hmac
 import os
+import sys
+import atexit
+import functools
+import queue
+import threading
+import re
+from collections import namedtuple
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, wait as wait_for_futures
 from datetime import date, timedelta
-try:
-    from tkcalendar import DateEntry
-except Exception:
-    DateEntry = None
 # Constants
 KG_PER_LB = 0.453592
 M_PER_INCH = 0.0254
+# scrypt cost parameters for password hashing (n=2**14, r=8 uses ~16 MB per hash)
+SCRYPT_N = 2 ** 14
+SCRYPT_R = 8
+SCRYPT_P = 1
+# Stored password hash = salt + derived key, as a raw BLOB
+SALT_BYTES = 16
+KEY_BYTES = 32
+# Positive whole number of calories, up to six digits
+CALORIES_PATTERN = re.compile(r"[1-9][0-9]{0,5}")
+
+# Interned so meal names loaded from the DB share these objects
+COMMON_MEALS = tuple(sys.intern(meal) for meal in (
+    "Chicken and Rice",
+    "Oatmeal",
+    "Protein Shake",
+    "Scrambled Eggs",
+    "Tuna Salad",
+    "Pasta with Sauce",
+    "Apple",
+    "Banana",
+))
+
+# Named fonts shared by every widget; filled in by setup_fonts() once a Tk root exists
+FONT_SPECS = {
+    'title': ('Arial', 16, 'bold'),
+    'heading': ('Arial', 14, 'bold'),
+    'section': ('Arial', 12, 'bold'),
+    'large': ('Arial', 12, 'normal'),
+    'button': ('Arial', 11, 'bold'),
+    'body': ('Arial', 11, 'normal'),
+    'label': ('Arial', 10, 'bold'),
+    'small': ('Arial', 10, 'normal'),
+    'small_italic': ('Arial', 10, 'italic'),
+    'caption': ('Arial', 9, 'normal'),
+    'caption_bold': ('Arial', 9, 'bold'),
+    'caption_italic': ('Arial', 9, 'italic'),
+    'mono': ('Consolas', 10, 'normal'),
+}
+FONTS = {}
+
+def setup_fonts(root):
+    if FONTS:
+        return
+    for name, (family, size, style) in FONT_SPECS.items():
+        weight = 'bold' if style == 'bold' else 'normal'
+        slant = 'italic' if style == 'italic' else 'roman'
+        FONTS[name] = tkfont.Font(root, family=family, size=size, weight=weight, slant=slant)
+
+# Exercise sidebar: (activity, estimated burn)
+RECOMMENDATIONS = (
+    ("Walk 30 min", "150 kcal"),
+    ("1 hour Strength Training", "300 kcal"),
+    ("20 min HIIT", "250 kcal"),
+    ("Yoga or Stretching", "80 kcal"),
+    ("Running 5k", "400 kcal"),
+    ("Cycling (Moderate)", "350 kcal"),
+)
+
+# One row of the entries table as the day view uses it; id is None until the row is written.
+# Named EntryRow so it isn't confused with tk.Entry widgets.
+EntryRow = namedtuple("EntryRow", "id meal calories")
 
 # Profile Calculator Class
 class ProfileCalculator:
@@ -22,14 +90,19 @@ class ProfileCalculator:
         "Moderate (3-5 days/wk)": 1.55,
         "Very Active (6-7 days/wk)": 1.725,
     }
+    ACTIVITY_LEVELS = tuple(ACTIVITY_FACTORS)
 
     def __init__(self, age, height_in, weight_lb, sex, activity_level):
         try:
             self.age = int(age)
             self.height_m = float(height_in) * M_PER_INCH
+            self.height_cm = self.height_m * 100
             self.weight_kg = float(weight_lb) * KG_PER_LB
             self.sex = sex
             self.activity_level = activity_level
+            # Fixed for the life of the profile, so resolved once here
+            self.sex_offset = 5 if sex == 'Male' else -161
+            self.activity_factor = self.ACTIVITY_FACTORS.get(activity_level, 1.2)
         except (ValueError, TypeError):
             raise ValueError("Profile data must be valid numbers.")
 
@@ -44,41 +117,194 @@ class ProfileCalculator:
         return "Obese"
 
     def calculate_bmr(self):
-        bmr = (10 * self.weight_kg) + (6.25 * (self.height_m / M_PER_INCH * 2.54)) - (5 * self.age)
-        if self.sex == 'Male':
-            bmr += 5
-        else:
-            bmr -= 161
+        bmr = (10 * self.weight_kg) + (6.25 * self.height_cm) - (5 * self.age) + self.sex_offset
         return round(bmr, 0)
 
     def calculate_tdee(self, bmr):
-        factor = self.ACTIVITY_FACTORS.get(self.activity_level, 1.2)
-        return round(bmr * factor, 0)
+        return round(bmr * self.activity_factor, 0)
+
+# Display strings for a day: ISO text, header date and the empty-day placeholder.
+# Cached so paging back and forth between days reuses them instead of re-running strftime.
+@functools.lru_cache(maxsize=64)
+def format_day(day):
+    return (
+        day.isoformat(),
+        day.strftime('%b %d, %Y'),
+        f"No entries tracked for {day.strftime('%A')}. Add a meal above!",
+    )
+
+# tkcalendar pulls in Babel's locale data, so it is only imported when the tracker is first built
+@functools.lru_cache(maxsize=None)
+def load_date_entry():
+    try:
+        from tkcalendar import DateEntry
+    except Exception:
+        return None
+    return DateEntry
 
 # Database Manager Class
 class DatabaseManager:
+    # Buffered entry inserts are written out once this many are queued
+    ENTRY_BATCH_SIZE = 32
+    # Idle read connections kept around for reuse
+    READ_POOL_SIZE = 4
+    # Rows per multi-row INSERT (4 bound values each, 500 per statement)
+    INSERT_CHUNK_ROWS = 125
+    # Stored in PRAGMA user_version once migrate_schema has run; bump it with each new step
+    SCHEMA_VERSION = 5
+
+    # Hot-path SQL, kept together as class constants
+    _SQL_SELECT_LOGIN = "SELECT id, password_hash FROM users WHERE username = ?"
+    _SQL_SELECT_PROFILE = "SELECT age, height, weight, goal_weight, sex, activity_level FROM users WHERE id=?"
+    _SQL_INSERT_USER = "INSERT INTO users (username, password_hash) VALUES (?, ?)"
+    _SQL_UPDATE_PASSWORD = "UPDATE users SET password_hash = ? WHERE id = ?"
+    _SQL_UPDATE_PROFILE = "UPDATE users SET age=?, height=?, weight=?, goal_weight=?, sex=?, activity_level=? WHERE id=?"
+    # Days are stored in entry_day as proleptic Gregorian ordinals (date.toordinal())
+    _SQL_INSERT_ENTRY = "INSERT INTO entries (user_id, meal, calories, entry_day) VALUES (?, ?, ?, ?)"
+    _SQL_INSERT_ENTRIES = _SQL_INSERT_ENTRY + ", (?, ?, ?, ?)" * (INSERT_CHUNK_ROWS - 1)
+    _SQL_SELECT_ENTRIES = "SELECT id, meal, calories FROM entries WHERE user_id = ? AND entry_day = ? AND id > ? ORDER BY id LIMIT ?"
+    _SQL_DAY_SUMMARY = "SELECT COALESCE(SUM(calories), 0), COUNT(*) FROM entries WHERE user_id = ? AND entry_day = ?"
+    _SQL_DAILY_TOTALS = """
+        SELECT entry_day, SUM(calories) as total
+        FROM entries
+        WHERE user_id = ? AND entry_day IS NOT NULL
+        GROUP BY entry_day
+        ORDER BY entry_day DESC
+        LIMIT ?
+    """
+    _SQL_DAILY_TOTALS_BEFORE = """
+        SELECT entry_day, SUM(calories) as total
+        FROM entries
+        WHERE user_id = ? AND entry_day < ?
+        GROUP BY entry_day
+        ORDER BY entry_day DESC
+        LIMIT ?
+    """
+    _SQL_TRACKED_DATES = "SELECT DISTINCT entry_day FROM entries WHERE user_id = ? AND entry_day IS NOT NULL"
+
     def __init__(self, db_name="calorie_tracker.db"):
-        self.conn = sqlite3.connect(db_name) 
+        self.db_name = db_name
+        # The one connection that writes. Entry inserts are committed on a background
+        # thread so a slow fsync never stalls the Tk event loop; the lock hands the
+        # connection between that thread and the few writes made from Tk callbacks.
+        self.conn = self.open_connection()
         self.cursor = self.conn.cursor()
-        self.create_tables()
-        self.ensure_date_column()
+        self._write_lock = threading.Lock()
+        # Queries borrow a pooled read-only connection; under WAL readers never wait on the writer
+        self._readers = queue.LifoQueue(maxsize=self.READ_POOL_SIZE)
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-writer")
+        self._last_write = None
+        self._pending = []
+        # The writer thread puts rows back on _pending when a batch fails, so both sides lock it
+        self._pending_lock = threading.Lock()
+        # Latest failed batch, kept until the UI reports it through take_write_error()
+        self.write_error = None
+        # Bumped on every saved entry so views can tell whether their data is stale
+        self.entries_generation = 0
+        # Per-user query results (day views, recent daily totals), reused
+        # until entries_generation moves on
+        self._query_cache = {}
+        self._query_cache_generation = self.entries_generation
+        # Days with at least one entry, per user: read once, then kept current by save_entries
+        self._tracked_days = {}
+        # Per-user count of changes to the tracked set; never reset, so views can compare it
+        self._tracked_versions = {}
+        # Profile rows by user id; only update_profile changes them
+        self._profile_cache = {}
+        self.closed = False
+        atexit.register(self.close)
+        self.migrate_schema()
         self.create_default_admin() 
         
+    def open_connection(self, query_only=False):
+        # Autocommit mode: single statements commit on their own, batches use explicit BEGIN.
+        conn = sqlite3.connect(self.db_name, isolation_level=None, check_same_thread=False)
+        conn.executescript(
+            "PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; PRAGMA temp_store=MEMORY; PRAGMA cache_size=-20000; PRAGMA mmap_size=268435456; PRAGMA foreign_keys=ON;"
+        )
+        if query_only:
+            conn.execute("PRAGMA query_only=ON")
+        return conn
+
+    @contextmanager
+    def borrow_connection(self):
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            conn = self.open_connection(query_only=True)
+        try:
+            yield conn
+        finally:
+            try:
+                self._readers.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+
+    def migrate_schema(self):
+        # Up-to-date files skip all the DDL below with a single PRAGMA read
+        version = self.cursor.execute("PRAGMA user_version").fetchone()[0]
+        if version >= self.SCHEMA_VERSION:
+            return
+        if version < 1:
+            self.create_tables()
+        if version < 2:
+            self.ensure_date_column()
+        if version < 3:
+            self.migrate_password_hashes()
+        if version < 4:
+            self.ensure_day_column()
+        if version < 5:
+            self.create_indexes()
+        self.cursor.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+
     def create_tables(self):
         self.cursor.execute(
-            "CREATE TABLE IF NOT EXISTS users (id INTEGER PRIMARY KEY AUTOINCREMENT, username TEXT UNIQUE NOT NULL, password_hash TEXT NOT NULL, age INTEGER, height INTEGER, weight REAL, goal_weight REAL, sex TEXT, activity_level TEXT)" 
+            "CREATE TABLE IF NOT EXISTS users (id INTEGER PRIMARY KEY AUTOINCREMENT, username TEXT UNIQUE NOT NULL, password_hash BLOB NOT NULL, age INTEGER, height INTEGER, weight REAL, goal_weight REAL, sex TEXT, activity_level TEXT)" 
         )
         self.cursor.execute(
-            "CREATE TABLE IF NOT EXISTS entries (id INTEGER PRIMARY KEY AUTOINCREMENT, user_id INTEGER, meal TEXT NOT NULL, calories INTEGER NOT NULL, entry_date TEXT, FOREIGN KEY (user_id) REFERENCES users(id))" 
+            "CREATE TABLE IF NOT EXISTS entries (id INTEGER PRIMARY KEY AUTOINCREMENT, user_id INTEGER, meal TEXT NOT NULL, calories INTEGER NOT NULL, entry_day INTEGER, FOREIGN KEY (user_id) REFERENCES users(id))" 
         )
-        self.conn.commit()
 
     def ensure_date_column(self):
         self.cursor.execute("PRAGMA table_info(entries)")
         cols = [c[1] for c in self.cursor.fetchall()]
-        if "entry_date" not in cols:
+        # Tables created with entry_day never had the text column and don't need it
+        if "entry_date" not in cols and "entry_day" not in cols:
             self.cursor.execute("ALTER TABLE entries ADD COLUMN entry_date TEXT")
-            self.conn.commit()
+
+    def ensure_day_column(self):
+        # entry_date used to hold ISO text; rows are now keyed by the integer entry_day.
+        # julianday('0001-01-01') is 1721425.5 and date(1, 1, 1).toordinal() is 1.
+        self.cursor.execute("PRAGMA table_info(entries)")
+        cols = [c[1] for c in self.cursor.fetchall()]
+        with self.conn:
+            self.cursor.execute("BEGIN IMMEDIATE")
+            if "entry_day" not in cols:
+                self.cursor.execute("ALTER TABLE entries ADD COLUMN entry_day INTEGER")
+            if "entry_date" in cols:
+                self.cursor.execute(
+                    "UPDATE entries SET entry_day = CAST(julianday(entry_date) - 1721424.5 AS INTEGER) "
+                    "WHERE entry_day IS NULL AND entry_date IS NOT NULL"
+                )
+
+    def migrate_password_hashes(self):
+        # Hashes used to be stored as SHA-256 hex text; keep the raw digest bytes
+        self.cursor.execute("SELECT id, password_hash FROM users WHERE typeof(password_hash) = 'text'")
+        rows = [(bytes.fromhex(hex_hash), user_id) for user_id, hex_hash in self.cursor.fetchall()]
+        if rows:
+            with self.conn:
+                self.cursor.execute("BEGIN IMMEDIATE")
+                self.cursor.executemany(self._SQL_UPDATE_PASSWORD, rows)
+
+    def create_indexes(self):
+        # Every entries query filters on the user and (almost always) the day.
+        # One index serves them all: the trailing calories column lets the SUM/GROUP BY
+        # queries read only the index, and a day's paged entry list sorts its few rows.
+        # A second (user_id, entry_day) index would be a prefix of it, paid for on every insert.
+        self.cursor.execute("DROP INDEX IF EXISTS idx_entries_user_date")
+        self.cursor.execute("DROP INDEX IF EXISTS idx_entries_user_date_cal")
+        self.cursor.execute("DROP INDEX IF EXISTS idx_entries_user_day")
+        self.cursor.execute("CREATE INDEX IF NOT EXISTS idx_entries_user_day_cal ON entries(user_id, entry_day, calories)")
 
     def create_default_admin(self): 
         username = "demo"
@@ -105,88 +331,242 @@ class DatabaseManager:
         
         today = date.today()
         
-        day1 = today - timedelta(days=2)
-        self.save_entry(user_id, "Oatmeal", 300, day1.isoformat())
-        self.save_entry(user_id, "Chicken & Veggies", 750, day1.isoformat())
-        self.save_entry(user_id, "Protein Shake", 200, day1.isoformat())
-        
-        day2 = today - timedelta(days=1)
-        self.save_entry(user_id, "Scrambled Eggs", 450, day2.isoformat())
-        self.save_entry(user_id, "Tuna Sandwich", 550, day2.isoformat())
-        self.save_entry(user_id, "Pasta Dinner", 800, day2.isoformat())
-        
-        self.conn.commit()
-
-    def hash_password(self, password):
-        return hashlib.sha256(password.encode()).hexdigest()
+        day1 = (today - timedelta(days=2)).toordinal()
+        day2 = (today - timedelta(days=1)).toordinal()
+        # Queued together so the whole seed goes out as one multi-row INSERT in one transaction
+        self.save_entries(user_id, [
+            ("Oatmeal", 300, day1),
+            ("Chicken & Veggies", 750, day1),
+            ("Protein Shake", 200, day1),
+            ("Scrambled Eggs", 450, day2),
+            ("Tuna Sandwich", 550, day2),
+            ("Pasta Dinner", 800, day2),
+        ])
+        self.flush_entries()
+
+    def hash_password(self, password, salt=None):
+        if salt is None:
+            salt = os.urandom(SALT_BYTES)
+        dk = hashlib.scrypt(password.encode('utf-8'), salt=salt, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P, dklen=KEY_BYTES)
+        return salt + dk
+
+    def is_salted_hash(self, stored_hash):
+        return len(stored_hash) == SALT_BYTES + KEY_BYTES
+
+    def legacy_hash_password(self, password):
+        # Unsalted SHA-256 digest written by earlier versions of the app
+        return hashlib.sha256(password.encode('utf-8')).digest()
+
+    def check_password(self, password, stored_hash):
+        if self.is_salted_hash(stored_hash):
+            return hmac.compare_digest(self.hash_password(password, stored_hash[:SALT_BYTES]), stored_hash)
+        return hmac.compare_digest(self.legacy_hash_password(password), stored_hash)
 
     def register_user(self, username, password):
+        hashed_pw = self.hash_password(password)
         try:
-            hashed_pw = self.hash_password(password)
-            self.cursor.execute("INSERT INTO users (username, password_hash) VALUES (?, ?)", (username, hashed_pw))
-            self.conn.commit()
-            return self.cursor.lastrowid
+            with self._write_lock:
+                self.cursor.execute(self._SQL_INSERT_USER, (username, hashed_pw))
+                return self.cursor.lastrowid
         except sqlite3.IntegrityError:
             return False
 
     def login_user(self, username, password):
-        hashed_pw = self.hash_password(password)
-        self.cursor.execute("SELECT id FROM users WHERE username = ? AND password_hash = ?", (username, hashed_pw))
-        user = self.cursor.fetchone()
+        with self.borrow_connection() as conn:
+            user = conn.execute(self._SQL_SELECT_LOGIN, (username,)).fetchone()
         
-        if user:
-            return user[0]
-        return None
+        if not user or not self.check_password(password, user[1]):
+            return None
+
+        # Re-hash legacy unsalted accounts with scrypt once the right password is given
+        if not self.is_salted_hash(user[1]):
+            new_hash = self.hash_password(password)
+            with self._write_lock:
+                self.cursor.execute(self._SQL_UPDATE_PASSWORD, (new_hash, user[0]))
+        return user[0]
 
     def update_profile(self, user_id, age, height, weight, goal_weight, sex, activity_level):
-        self.cursor.execute(
-            "UPDATE users SET age=?, height=?, weight=?, goal_weight=?, sex=?, activity_level=? WHERE id=?",
-            (age, height, weight, goal_weight, sex, activity_level, user_id)
-        )
-        self.conn.commit()
+        with self._write_lock:
+            self.cursor.execute(
+                self._SQL_UPDATE_PROFILE,
+                (age, height, weight, goal_weight, sex, activity_level, user_id)
+            )
+        self._profile_cache.pop(user_id, None)
 
     def get_user_profile(self, user_id):
-        self.cursor.execute("SELECT age, height, weight, goal_weight, sex, activity_level FROM users WHERE id=?", (user_id,))
-        return self.cursor.fetchone()
+        if user_id not in self._profile_cache:
+            with self.borrow_connection() as conn:
+                self._profile_cache[user_id] = conn.execute(self._SQL_SELECT_PROFILE, (user_id,)).fetchone()
+        return self._profile_cache[user_id]
     
-    def save_entry(self, user_id, meal, calories, entry_date=None):
-        if entry_date is None:
-            entry_date = date.today().isoformat()
-        self.cursor.execute(
-            "INSERT INTO entries (user_id, meal, calories, entry_date) VALUES (?, ?, ?, ?)",
-            (user_id, meal, calories, entry_date)
-        )
-        self.conn.commit()
-
-    def load_entries(self, user_id, entry_date=None):
-        if entry_date is None:
-            entry_date = date.today().isoformat()
-        self.cursor.execute(
-            "SELECT meal, calories FROM entries WHERE user_id = ? AND entry_date = ?",
-            (user_id, entry_date)
-        )
-        return [{'meal': row[0], 'calories': row[1]} for row in self.cursor.fetchall()]
-
-    def load_daily_totals(self, user_id, limit=30):
-        self.cursor.execute(
-            """
-            SELECT entry_date, SUM(calories) as total
-            FROM entries
-            WHERE user_id = ?
-            GROUP BY entry_date
-            ORDER BY entry_date DESC
-            LIMIT ?
-            """,
-            (user_id, limit)
-        )
-        return [{'date': row[0], 'total': row[1]} for row in self.cursor.fetchall()]
+    def save_entry(self, user_id, meal, calories, entry_day=None):
+        self.save_entries(user_id, [(meal, calories, entry_day)])
+
+    def save_entries(self, user_id, items):
+        # items: (meal, calories, entry_day) tuples, days as date ordinals; None means today
+        today = date.today().toordinal()
+        rows = [(user_id, meal, calories, entry_day or today) for meal, calories, entry_day in items]
+        with self._pending_lock:
+            self._pending.extend(rows)
+        tracked = self._tracked_days.get(user_id)
+        if tracked is not None:
+            count = len(tracked)
+            tracked.update(row[3] for row in rows)
+            if len(tracked) != count:
+                self.bump_tracked_version(user_id)
+        self.entries_generation += 1
+        if len(self._pending) >= self.ENTRY_BATCH_SIZE:
+            self.flush_entries()
+
+    def flush_entries(self, wait=False):
+        with self._pending_lock:
+            rows, self._pending = self._pending, []
+        if rows:
+            self._last_write = self._writer.submit(self.write_entries, rows)
+        write = self._last_write
+        if wait and write is not None:
+            # Consumed here, so a failed batch is not raised again by every later read;
+            # the failure itself is kept in write_error for the UI to report
+            self._last_write = None
+            wait_for_futures((write,))
+        return write
+
+    def write_entries(self, rows):
+        try:
+            with self._write_lock, self.conn:
+                self.conn.execute("BEGIN IMMEDIATE")
+                # Full chunks share one multi-row statement and the tail reuses the single-row one,
+                # so the batch never adds new SQL text to the statement cache
+                full = len(rows) - len(rows) % self.INSERT_CHUNK_ROWS
+                for start in range(0, full, self.INSERT_CHUNK_ROWS):
+                    chunk = rows[start:start + self.INSERT_CHUNK_ROWS]
+                    self.conn.execute(self._SQL_INSERT_ENTRIES, [value for row in chunk for value in row])
+                self.conn.executemany(self._SQL_INSERT_ENTRY, rows[full:])
+        except sqlite3.Error as e:
+            # Busy/locked/disk errors are worth retrying with the next flush; rows that
+            # violate a constraint would fail again, so those are dropped and only reported
+            if isinstance(e, sqlite3.OperationalError):
+                with self._pending_lock:
+                    self._pending[:0] = rows
+            self.write_error = e
+            raise
+
+    def take_write_error(self):
+        error, self.write_error = self.write_error, None
+        return error
+
+    def discard_cached_results(self):
+        # After a failed write the cached days and totals may count rows that never reached disk
+        self._tracked_days.clear()
+        self._query_cache.clear()
+        self.entries_generation += 1
+
+    def close(self):
+        # The writer drains its queue first; anything saved after that is written inline
+        # Safe to call twice: atexit runs it again after an explicit close
+        if self.closed:
+            return
+        self.closed = True
+        self._writer.shutdown(wait=True)
+        with self._pending_lock:
+            rows, self._pending = self._pending, []
+        try:
+            if rows:
+                self.write_entries(rows)
+        finally:
+            self.conn.close()
+            while True:
+                try:
+                    self._readers.get_nowait().close()
+                except queue.Empty:
+                    break
+
+    def load_entries(self, user_id, entry_day=None, limit=200, after_id=0):
+        # Keyset pagination: the next page starts after the last id already shown
+        if entry_day is None:
+            entry_day = date.today().toordinal()
+        self.flush_entries(wait=True)
+        with self.borrow_connection() as conn:
+            rows = conn.execute(self._SQL_SELECT_ENTRIES, (user_id, entry_day, after_id, limit)).fetchall()
+        return [EntryRow(entry_id, sys.intern(meal), calories) for entry_id, meal, calories in rows]
+
+    def load_day_and_history(self, user_id, entry_day, page_size=200, history_limit=30):
+        # Everything the day view needs, read from one connection and one snapshot:
+        # the day's (total, count), its first page of entries, the recent daily totals
+        # and the dates the calendar highlights. Revisiting a day with no new entries
+        # since it was last read is answered from the cache without touching SQLite.
+        day = self.cached_result(("day", user_id, entry_day, page_size))
+        history = self.cached_result(("history", user_id, history_limit))
+        tracked = self._tracked_days.get(user_id)
+        if day is not None and history is not None and tracked is not None:
+            return day[0], day[1], history, tracked
+
+        self.flush_entries(wait=True)
+        with self.borrow_connection() as conn, conn:
+            conn.execute("BEGIN")
+            if day is None:
+                summary = conn.execute(self._SQL_DAY_SUMMARY, (user_id, entry_day)).fetchone()
+                rows = conn.execute(self._SQL_SELECT_ENTRIES, (user_id, entry_day, 0, page_size)).fetchall() if summary[1] else []
+                entries = [EntryRow(entry_id, sys.intern(meal), calories) for entry_id, meal, calories in rows]
+                day = self.store_result(("day", user_id, entry_day, page_size), (summary, entries))
+            if history is None:
+                history = self.store_result(("history", user_id, history_limit),
+                                            conn.execute(self._SQL_DAILY_TOTALS, (user_id, history_limit)).fetchall())
+            if tracked is None:
+                tracked = self._tracked_days[user_id] = {row[0] for row in conn.execute(self._SQL_TRACKED_DATES, (user_id,))}
+                self.bump_tracked_version(user_id)
+        return day[0], day[1], history, tracked
+
+    def cached_result(self, key):
+        if self._query_cache_generation != self.entries_generation:
+            return None
+        return self._query_cache.get(key)
+
+    def store_result(self, key, result):
+        # Results from an older generation are all stale, so drop them rather than let days pile up
+        if self._query_cache_generation != self.entries_generation:
+            self._query_cache.clear()
+            self._query_cache_generation = self.entries_generation
+        self._query_cache[key] = result
+        return result
+
+    def load_daily_totals(self, user_id, limit=30, before_day=None):
+        # before_day continues a previous page from its last (oldest) day
+        if before_day is None:
+            history = self.cached_result(("history", user_id, limit))
+            if history is not None:
+                return history
+        self.flush_entries(wait=True)
+        with self.borrow_connection() as conn:
+            if before_day is None:
+                return self.store_result(("history", user_id, limit), conn.execute(self._SQL_DAILY_TOTALS, (user_id, limit)).fetchall())
+            return conn.execute(self._SQL_DAILY_TOTALS_BEFORE, (user_id, before_day, limit)).fetchall()
 
     def load_tracked_dates(self, user_id): 
-        self.cursor.execute(                          
-            "SELECT DISTINCT entry_date FROM entries WHERE user_id = ? AND entry_date IS NOT NULL", 
-            (user_id,)                                
-        )                                             
-        return [row[0] for row in self.cursor.fetchall()] 
+        tracked = self._tracked_days.get(user_id)
+        if tracked is None:
+            self.flush_entries(wait=True)
+            with self.borrow_connection() as conn:
+                tracked = self._tracked_days[user_id] = {row[0] for row in conn.execute(self._SQL_TRACKED_DATES, (user_id,))}
+            self.bump_tracked_version(user_id)
+        return tracked
+
+    def bump_tracked_version(self, user_id):
+        self._tracked_versions[user_id] = self._tracked_versions.get(user_id, 0) + 1
+
+    def tracked_days_version(self, user_id):
+        return self._tracked_versions.get(user_id, 0)
+
+# One manager (connections, writer thread, caches) per database file for the life of the process
+_databases = {}
+
+def get_database(db_name="calorie_tracker.db"):
+    # Keyed on the absolute path so "x.db" and "./x.db" share one manager and one writer
+    path = os.path.abspath(db_name)
+    db = _databases.get(path)
+    if db is None:
+        db = _databases[path] = DatabaseManager(path)
+    return db
 
 # Profile Setup Window Class
 class ProfileSetupWindow:
@@ -211,7 +591,7 @@ class ProfileSetupWindow:
         profile_frame.grid(row=0, column=0, padx=30, pady=30, sticky="nsew")
         profile_frame.grid_columnconfigure(1, weight=1)
 
-        tk.Label(profile_frame, text="Set Up Your Fitness Profile", bg="#e0e0e0", font=('Arial', 14, 'bold')).grid(row=0, column=0, columnspan=2, pady=(0, 20), sticky="n")
+        tk.Label(profile_frame, text="Set Up Your Fitness Profile", bg="#e0e0e0", font=FONTS['heading']).grid(row=0, column=0, columnspan=2, pady=(0, 20), sticky="n")
 
         #Input Fields
         fields = [
@@ -222,31 +602,33 @@ class ProfileSetupWindow:
         self.entries = {}
 
         for i, (text, row) in enumerate(fields):
-            tk.Label(profile_frame, text=text, bg="#e0e0e0", font=('Arial', 11)).grid(row=row, column=0, sticky="w", pady=5, padx=(0, 10))
-            entry = tk.Entry(profile_frame, width=20, font=('Arial', 11))
+            tk.Label(profile_frame, text=text, bg="#e0e0e0", font=FONTS['body']).grid(row=row, column=0, sticky="w", pady=5, padx=(0, 10))
+            entry = tk.Entry(profile_frame, width=20, font=FONTS['body'])
             entry.grid(row=row, column=1, pady=5, sticky="ew")
             self.entries[text] = entry
-        tk.Label(profile_frame, text="Height:", bg="#e0e0e0", font=('Arial', 11)).grid(row=2, column=0, sticky="w", pady=5, padx=(0, 10))
+        tk.Label(profile_frame, text="Height:", bg="#e0e0e0", font=FONTS['body']).grid(row=2, column=0, sticky="w", pady=5, padx=(0, 10))
         height_frame = tk.Frame(profile_frame, bg="#e0e0e0")
         height_frame.grid(row=2, column=1, sticky="ew")  
-        self.feet_entry = tk.Entry(height_frame, width=4, font=('Arial', 11))
+        self.feet_entry = tk.Entry(height_frame, width=4, font=FONTS['body'])
         self.feet_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        tk.Label(height_frame, text=" ft ", bg="#e0e0e0", font=('Arial', 11)).pack(side=tk.LEFT)
-        self.inches_entry = tk.Entry(height_frame, width=4, font=('Arial', 11))
+        tk.Label(height_frame, text=" ft ", bg="#e0e0e0", font=FONTS['body']).pack(side=tk.LEFT)
+        self.inches_entry = tk.Entry(height_frame, width=4, font=FONTS['body'])
         self.inches_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        tk.Label(height_frame, text=" in ", bg="#e0e0e0", font=('Arial', 11)).pack(side=tk.LEFT)
-        tk.Label(profile_frame, text="Sex:", bg="#e0e0e0", font=('Arial', 11)).grid(row=5, column=0, sticky="w", pady=5, padx=(0, 10))
+        tk.Label(height_frame, text=" in ", bg="#e0e0e0", font=FONTS['body']).pack(side=tk.LEFT)
+        tk.Label(profile_frame, text="Sex:", bg="#e0e0e0", font=FONTS['body']).grid(row=5, column=0, sticky="w", pady=5, padx=(0, 10))
         self.sex_var = tk.StringVar(value='Female')
-        self.sex_combo = ttk.Combobox(profile_frame, textvariable=self.sex_var, values=['Female', 'Male'], state='readonly', width=20, font=('Arial', 11))
+        self.sex_combo = ttk.Combobox(profile_frame, textvariable=self.sex_var, values=['Female', 'Male'], state='readonly', width=20, font=FONTS['body'])
         self.sex_combo.grid(row=5, column=1, pady=5, sticky="ew")
-        tk.Label(profile_frame, text="Activity Level:", bg="#e0e0e0", font=('Arial', 11)).grid(row=6, column=0, sticky="w", pady=5, padx=(0, 10))
-        self.activity_var = tk.StringVar(value=ProfileCalculator.ACTIVITY_FACTORS.keys().__iter__().__next__())
-        self.activity_combo = ttk.Combobox(profile_frame, textvariable=self.activity_var, values=list(ProfileCalculator.ACTIVITY_FACTORS.keys()), state='readonly', width=20, font=('Arial', 11))
+        tk.Label(profile_frame, text="Activity Level:", bg="#e0e0e0", font=FONTS['body']).grid(row=6, column=0, sticky="w", pady=5, padx=(0, 10))
+        self.activity_var = tk.StringVar(value=ProfileCalculator.ACTIVITY_LEVELS[0])
+        self.activity_combo = ttk.Combobox(profile_frame, textvariable=self.activity_var, values=ProfileCalculator.ACTIVITY_LEVELS, state='readonly', width=20, font=FONTS['body'])
         self.activity_combo.grid(row=6, column=1, pady=5, sticky="ew")
-        tk.Button(profile_frame, text="Save & Start Tracking", command=self.save_profile, bg="#28a745", fg="white", font=('Arial', 12, 'bold')).grid(row=7, column=0, columnspan=2, pady=(30, 0), sticky="ew", ipady=8)
+        tk.Button(profile_frame, text="Save & Start Tracking", command=self.save_profile, bg="#28a745", fg="white", font=FONTS['section']).grid(row=7, column=0, columnspan=2, pady=(30, 0), sticky="ew", ipady=8)
 
     def on_close(self):
-        messagebox.showwarning("Warning", "You must save your profile to start tracking.", parent=self.profile_win)
+        # The main window is still withdrawn, so closing this dialog is the only way out
+        if messagebox.askokcancel("Quit", "You must save your profile to start tracking. Quit without saving?", parent=self.profile_win):
+            self.master.destroy()
 
     def save_profile(self):
         try:
@@ -295,18 +677,18 @@ class AuthWindow:
         auth_frame.grid(row=0, column=0, padx=50, pady=50, sticky="nsew")
         auth_frame.grid_columnconfigure(1, weight=1)
         
-        tk.Label(auth_frame, text="Welcome to the Tracker", bg="#f0f0f0", font=('Arial', 16, 'bold')).grid(row=0, column=0, columnspan=2, pady=(0, 25), sticky="n")
+        tk.Label(auth_frame, text="Welcome to the Tracker", bg="#f0f0f0", font=FONTS['title']).grid(row=0, column=0, columnspan=2, pady=(0, 25), sticky="n")
 
-        tk.Label(auth_frame, text="Username:", bg="#f0f0f0", font=('Arial', 12)).grid(row=1, column=0, sticky="w", pady=10, padx=(0, 10))
-        self.username_entry = tk.Entry(auth_frame, width=30, font=('Arial', 12))
+        tk.Label(auth_frame, text="Username:", bg="#f0f0f0", font=FONTS['large']).grid(row=1, column=0, sticky="w", pady=10, padx=(0, 10))
+        self.username_entry = tk.Entry(auth_frame, width=30, font=FONTS['large'])
         self.username_entry.grid(row=1, column=1, padx=5, pady=10, sticky="ew")
 
-        tk.Label(auth_frame, text="Password:", bg="#f0f0f0", font=('Arial', 12)).grid(row=2, column=0, sticky="w", pady=10, padx=(0, 10))
-        self.password_entry = tk.Entry(auth_frame, width=30, show="*", font=('Arial', 12))
+        tk.Label(auth_frame, text="Password:", bg="#f0f0f0", font=FONTS['large']).grid(row=2, column=0, sticky="w", pady=10, padx=(0, 10))
+        self.password_entry = tk.Entry(auth_frame, width=30, show="*", font=FONTS['large'])
         self.password_entry.grid(row=2, column=1, padx=5, pady=10, sticky="ew")
 
-        tk.Button(auth_frame, text="Login", command=self.login, bg="#007bff", fg="white", font=('Arial', 12, 'bold')).grid(row=3, column=0, columnspan=2, pady=(20, 10), sticky="ew", ipady=5)
-        tk.Button(auth_frame, text="Register New Account", command=self.register, bg="#28a745", fg="white", font=('Arial', 12)).grid(row=4, column=0, columnspan=2, pady=(5, 0), sticky="ew", ipady=5)
+        tk.Button(auth_frame, text="Login", command=self.login, bg="#007bff", fg="white", font=FONTS['section']).grid(row=3, column=0, columnspan=2, pady=(20, 10), sticky="ew", ipady=5)
+        tk.Button(auth_frame, text="Register New Account", command=self.register, bg="#28a745", fg="white", font=FONTS['large']).grid(row=4, column=0, columnspan=2, pady=(5, 0), sticky="ew", ipady=5)
     
     def on_close(self):
         self.master.destroy()
@@ -340,7 +722,8 @@ class AuthWindow:
 
         if user_id:
             self.auth_win.destroy()
-            self.master.deiconify() 
+            # The main window stays withdrawn until the profile is saved; it may still
+            # hold the previous user's tracker widgets
             ProfileSetupWindow(self.master, self.db, user_id, username, self.login_success_callback)
         else:
             messagebox.showerror("Registration Error", "Username already exists. Please choose a different one.", parent=self.auth_win)
@@ -348,36 +731,68 @@ class AuthWindow:
 
 # Main Application Class
 class CalorieTrackerApp:
+    # Entries are read into the Text widget one page at a time as the user scrolls
+    ENTRY_PAGE_SIZE = 200
+    HISTORY_PAGE_SIZE = 30
+    # Delay before re-submitting entries whose write hit a busy or locked database
+    WRITE_RETRY_MS = 2000
+
     def __init__(self, master):
         self.master = master
-        self.db = DatabaseManager()
+        setup_fonts(master)
+        self.db = get_database()
         self.current_user_id = None
         self.current_username = None
-
+        self.entries_more = False
+        # Set while a load_more_entries call is queued, so scroll events don't queue more
+        self.entries_load_pending = False
+        self.main_built = False
+        self.flush_job = None
+        # True while buffered entries are waiting on a retry, so the warning is shown once
+        self.write_retrying = False
+        self.refresh_job = None
+        self.date_picker = None
+        # Day ordinal -> calendar event id for the days currently highlighted
+        self.highlighted_events = {}
+        self.highlight_signature = None
+        self.displayed_state = None
+
+        self.master.protocol("WM_DELETE_WINDOW", self.on_close)
         self.show_auth_window()
 
+    def on_close(self):
+        self.flush_pending_entries()
+        self.master.destroy()
+
     def show_auth_window(self):
-        for widget in self.master.winfo_children():
-            widget.destroy()
+        # The main tracker widgets are kept (withdrawn) and rebound on the next login
         AuthWindow(self.master, self.db, self.show_main_tracker)
     
     def logout(self):
+        self.flush_pending_entries()
+        self.cancel_scheduled_update()
         self.current_user_id = None
         self.current_username = None
         self.master.title("Calorie Counter")
         self.master.geometry("200x200")
         self.show_auth_window()
 
+    def set_selected_date(self, selected):
+        # Format the date once per change rather than on every refresh
+        self.selected_date = selected
+        self.selected_day = selected.toordinal()
+        self.selected_iso, self.selected_pretty, self.selected_empty_text = format_day(selected)
+
     def change_day(self, delta_days):
-        self.selected_date = self.selected_date + timedelta(days=delta_days)
+        self.set_selected_date(self.selected_date + timedelta(days=delta_days))
         if hasattr(self, "date_label_var"):
-            self.date_label_var.set(self.selected_date.isoformat())
-        if hasattr(self, "date_picker") and self.date_picker is not None:
+            self.date_label_var.set(self.selected_iso)
+        if self.date_picker is not None:
             self.date_picker.set_date(self.selected_date)
-        self.update_display()
+        self.schedule_update()
 
-    def highlight_tracked_dates(self): 
-        if DateEntry is None or not hasattr(self, 'date_picker'): 
+    def highlight_tracked_dates(self, tracked_days=None): 
+        if self.date_picker is None: 
             return                                                 
         
         calendar_widget = self.date_picker 
@@ -385,27 +800,60 @@ class CalorieTrackerApp:
         if not hasattr(calendar_widget, 'calevent_remove'):
             return
 
-        calendar_widget.calevent_remove('all') 
-        
-        tracked_dates_str = self.db.load_tracked_dates(self.current_user_id) 
-        
+        if tracked_days is None:
+            tracked_days = self.db.load_tracked_dates(self.current_user_id) 
+        # The version moves whenever the user's tracked set gains a day or is reloaded,
+        # so an unchanged version is exactly what was drawn last time
+        signature = (self.current_user_id, self.db.tracked_days_version(self.current_user_id))
+        if signature == self.highlight_signature:
+            return
+        self.highlight_signature = signature
+
+        # Only days that gained or lost entries since the last draw touch the calendar
+        events = self.highlighted_events
+        removed = events.keys() - tracked_days
+        added = tracked_days - events.keys()
+        if not removed and not added:
+            return
+
         calendar_widget.tag_config(
             'tracked_day', 
             background='#4CAF50', 
             foreground='white'  
         )
         
-        for date_str in tracked_dates_str:
-            try:
-                d = date.fromisoformat(date_str)
-                calendar_widget.calevent_configure(d, tags=('tracked_day',))
-            except ValueError:
-                continue
+        for day in removed:
+            calendar_widget.calevent_remove(events.pop(day))
+        for day in added:
+            events[day] = calendar_widget.calevent_create(date.fromordinal(day), "Tracked", tags=('tracked_day',))
+
+    def build_profile_labels(self, profile_frame):
+        # Created once; calculate_and_display_profile only changes their text and colour
+        self.profile_message = tk.Label(profile_frame, fg="red", bg="#f0f0f0")
+        self.profile_message.grid(row=0, column=0, sticky="w", pady=5)
+        self.profile_title = tk.Label(profile_frame, text="Metrics Summary", bg="#e0e0e0", font=FONTS['section'])
+        self.profile_title.grid(row=0, column=0, columnspan=2, pady=(0, 5), sticky="ew")
+        self.profile_rows = []
+        for row in range(1, 5):
+            name = tk.Label(profile_frame, anchor='w', justify='left', bg="#f0f0f0", font=FONTS['label'])
+            name.grid(row=row, column=0, sticky='w', padx=5, pady=2)
+            value = tk.Label(profile_frame, anchor='e', justify='right', bg="#f0f0f0", font=FONTS['label'])
+            value.grid(row=row, column=1, sticky='e', padx=5, pady=2)
+            self.profile_rows.append((name, value))
+        profile_frame.grid_columnconfigure(1, weight=1)
+
+    def show_profile_message(self, text):
+        self.profile_title.grid_remove()
+        for name, value in self.profile_rows:
+            name.grid_remove()
+            value.grid_remove()
+        self.profile_message.config(text=text)
+        self.profile_message.grid()
 
-    def calculate_and_display_profile(self, profile_frame):
+    def calculate_and_display_profile(self):
         profile_data = self.db.get_user_profile(self.current_user_id)
         if not profile_data or any(x is None for x in profile_data):
-            tk.Label(profile_frame, text="Profile Data Missing. Please update.", fg="red", bg="#f0f0f0").grid(row=0, column=0, sticky="w", pady=5)
+            self.show_profile_message("Profile Data Missing. Please update.")
             return
 
         age, height_in, weight_lb, goal_weight_lb, sex, activity_level = profile_data
@@ -423,62 +871,56 @@ class CalorieTrackerApp:
             
             if goal_weight_lb < weight_lb and tdee_goal < safety_floor:
                 tdee_goal = safety_floor
-            def create_label(parent, text, value, row, color="#333333"):
-                tk.Label(parent, text=text, anchor='w', justify='left', bg="#f0f0f0", font=('Arial', 10, 'bold')).grid(row=row, column=0, sticky='w', padx=5, pady=2)
-                tk.Label(parent, text=value, anchor='e', justify='right', bg="#f0f0f0", fg=color, font=('Arial', 10, 'bold')).grid(row=row, column=1, sticky='e', padx=5, pady=2)
-                profile_frame.grid_columnconfigure(1, weight=1)
 
-            tk.Label(profile_frame, text="Metrics Summary", bg="#e0e0e0", font=('Arial', 12, 'bold')).grid(row=0, column=0, columnspan=2, pady=(0, 5), sticky="ew")
-            
-            #BMI
-            create_label(profile_frame, "Current BMI:", f"{current_bmi:.1f} ({bmi_category})", 1, color=("#4CAF50" if bmi_category == "Healthy Weight" else "#FF9800"))
-            
-            #Maintenance Calories
-            create_label(profile_frame, "Daily Maintenance (TDEE):", f"{tdee_maintenance:.0f} kcal", 2, color="#0056b3")
-            
             #Goal Calories
             goal_text = "Loss Target" if goal_weight_lb < weight_lb else "Gain Target" if goal_weight_lb > weight_lb else "Maintain Target"
             
             goal_display = f"{tdee_goal:.0f} kcal"
             if goal_weight_lb < weight_lb and tdee_goal == safety_floor:
                 goal_display += " (Safety Floor)"
-                
-            create_label(profile_frame, f"Goal Calories ({goal_text}):", goal_display, 3, color="#DC3545")
             
-            #Row 4: Healthy BMI Range
+            #Healthy BMI Range
             height_m = float(height_in) * M_PER_INCH
             min_weight_kg = 18.5 * (height_m ** 2)
             max_weight_kg = 24.9 * (height_m ** 2)
             min_weight_lb = round(min_weight_kg / KG_PER_LB, 0)
             max_weight_lb = round(max_weight_kg / KG_PER_LB, 0)
-            create_label(profile_frame, "Healthy Weight Range(CDC):", f"{min_weight_lb:.0f} - {max_weight_lb:.0f} lbs", 4)
-
 
         except ValueError as e:
-            tk.Label(profile_frame, text=f"Error in calculation: {e}", fg="red", bg="#f0f0f0").grid(row=0, column=0, sticky="w", pady=5)
+            self.show_profile_message(f"Error in calculation: {e}")
+            return
+
+        metrics = (
+            ("Current BMI:", f"{current_bmi:.1f} ({bmi_category})", "#4CAF50" if bmi_category == "Healthy Weight" else "#FF9800"),
+            ("Daily Maintenance (TDEE):", f"{tdee_maintenance:.0f} kcal", "#0056b3"),
+            (f"Goal Calories ({goal_text}):", goal_display, "#DC3545"),
+            ("Healthy Weight Range(CDC):", f"{min_weight_lb:.0f} - {max_weight_lb:.0f} lbs", "#333333"),
+        )
+        self.profile_message.grid_remove()
+        self.profile_title.grid()
+        for (name, value), (text, value_text, color) in zip(self.profile_rows, metrics):
+            name.config(text=text)
+            name.grid()
+            value.config(text=value_text, fg=color)
+            value.grid()
 
 
     def show_main_tracker(self, user_id, username):
         self.current_user_id = user_id
         self.current_username = username
-        self.selected_date = date.today()
-        
-        self.common_meals = [
-            "Chicken and Rice",
-            "Oatmeal",
-            "Protein Shake",
-            "Scrambled Eggs",
-            "Tuna Salad",
-            "Pasta with Sauce",
-            "Apple",
-            "Banana"
-        ]
+        self.set_selected_date(date.today())
+
+        self.master.title(f"Calorie Counter - Logged in as: {username}")
+        self.master.geometry("900x700") 
+        self.master.deiconify()
+
+        if self.main_built:
+            self.bind_user()
+            return
 
         for widget in self.master.winfo_children():
             widget.destroy()
 
-        self.master.title(f"Calorie Counter - Logged in as: {username}")
-        self.master.geometry("900x700") 
         self.master.config(bg="#f0f0f0")
         
         self.master.grid_columnconfigure(0, weight=3) 
@@ -494,18 +936,17 @@ class CalorieTrackerApp:
         header_frame.grid(row=0, column=0, padx=0, pady=(0, 5), sticky="ew")
         header_frame.grid_columnconfigure(0, weight=1)
         
-        user_label = tk.Label(header_frame, text=f"User: {username} | ID: {user_id}", bg="#e0e0e0", font=('Arial', 9, 'italic'))
-        user_label.grid(row=0, column=0, sticky="w", padx=5)
+        self.user_label = tk.Label(header_frame, bg="#e0e0e0", font=FONTS['caption_italic'])
+        self.user_label.grid(row=0, column=0, sticky="w", padx=5)
 
         tk.Button(header_frame, text="Logout", command=self.logout, 
-                  bg="#dc3545", fg="white", activebackground="#c82333", font=('Arial', 9, 'bold')).grid(row=0, column=1, sticky="e", padx=5)
+                  bg="#dc3545", fg="white", activebackground="#c82333", font=FONTS['caption_bold']).grid(row=0, column=1, sticky="e", padx=5)
 
         #Profile Display Area
-        profile_display_frame = tk.Frame(main_content_frame, padx=15, pady=15, bg="#f0f0f0", relief=tk.GROOVE, bd=1)
-        profile_display_frame.grid(row=1, column=0, padx=0, pady=5, sticky="ew")
-        profile_display_frame.grid_columnconfigure(0, weight=1)
-        
-        self.calculate_and_display_profile(profile_display_frame)
+        self.profile_display_frame = tk.Frame(main_content_frame, padx=15, pady=15, bg="#f0f0f0", relief=tk.GROOVE, bd=1)
+        self.profile_display_frame.grid(row=1, column=0, padx=0, pady=5, sticky="ew")
+        self.profile_display_frame.grid_columnconfigure(0, weight=1)
+        self.build_profile_labels(self.profile_display_frame)
         
         #Input Frame
         input_frame = tk.Frame(main_content_frame, padx=15, pady=15, bg="#e0e0e0")
@@ -522,42 +963,40 @@ class CalorieTrackerApp:
         date_frame.grid_columnconfigure(3, weight=0) 
         date_frame.grid_columnconfigure(4, weight=1) 
 
-        tk.Label(date_frame, text="Date:", bg="#e0e0e0", font=('Arial', 10, 'bold')).grid(row=0, column=0, padx=(0,8), sticky='e') 
+        tk.Label(date_frame, text="Date:", bg="#e0e0e0", font=FONTS['label']).grid(row=0, column=0, padx=(0,8), sticky='e') 
         
         tk.Button(date_frame, text="◀ Prev", command=lambda: self.change_day(-1)).grid(row=0, column=1, sticky="w")
         
-        date_font = ('Arial', 12) 
-        
+        DateEntry = load_date_entry()
         if DateEntry is not None:
             self.date_picker = DateEntry(date_frame, width=15, background='darkblue', foreground='white', 
-                                         borderwidth=2, date_pattern="yyyy-mm-dd", font=date_font)
-            self.date_picker.set_date(self.selected_date)
+                                         borderwidth=2, date_pattern="yyyy-mm-dd", font=FONTS['large'])
             self.date_picker.grid(row=0, column=2, padx=8) 
             def _on_date_change(*_):
-                self.selected_date = self.date_picker.get_date()
-                self.update_display()
+                self.set_selected_date(self.date_picker.get_date())
+                self.schedule_update()
             self.date_picker.bind("<<DateEntrySelected>>", lambda e: _on_date_change())
         else:
-            self.date_label_var = tk.StringVar(value=self.selected_date.isoformat())
-            tk.Label(date_frame, textvariable=self.date_label_var, bg="#e0e0e0", font=('Arial', 10)).grid(row=0, column=2, padx=8) 
+            self.date_label_var = tk.StringVar(value=self.selected_iso)
+            tk.Label(date_frame, textvariable=self.date_label_var, bg="#e0e0e0", font=FONTS['small']).grid(row=0, column=2, padx=8) 
             
         tk.Button(date_frame, text="Next ▶", command=lambda: self.change_day(1)).grid(row=0, column=3, sticky="w") 
             
-        tk.Label(input_frame, text="Meal/Item:", bg="#e0e0e0", font=('Arial', 10, 'bold')).grid(row=1, column=0, sticky="w", pady=5, padx=5)
+        tk.Label(input_frame, text="Meal/Item:", bg="#e0e0e0", font=FONTS['label']).grid(row=1, column=0, sticky="w", pady=5, padx=5)
         
         self.meal_var = tk.StringVar()
         self.meal_entry = ttk.Combobox(
             input_frame, 
             textvariable=self.meal_var, 
-            values=self.common_meals,
+            values=COMMON_MEALS,
             state="normal",
             width=30, 
-            font=('Arial', 10)
+            font=FONTS['small']
         )
         self.meal_entry.grid(row=1, column=1, padx=5, pady=5, sticky="ew")
 
-        tk.Label(input_frame, text="Calories:", bg="#e0e0e0", font=('Arial', 10, 'bold')).grid(row=2, column=0, sticky="w", pady=5, padx=5)
-        self.calories_entry = tk.Entry(input_frame, width=30, font=('Arial', 10))
+        tk.Label(input_frame, text="Calories:", bg="#e0e0e0", font=FONTS['label']).grid(row=2, column=0, sticky="w", pady=5, padx=5)
+        self.calories_entry = tk.Entry(input_frame, width=30, font=FONTS['small'])
         self.calories_entry.grid(row=2, column=1, padx=5, pady=5, sticky="ew")
 
         self.add_button = tk.Button(
@@ -567,7 +1006,7 @@ class CalorieTrackerApp:
             bg="#4CAF50", 
             fg="white", 
             activebackground="#45a049", 
-            font=('Arial', 11, 'bold')
+            font=FONTS['button']
         )
         self.add_button.grid(row=3, column=0, columnspan=2, pady=10, sticky="ew")
 
@@ -580,13 +1019,13 @@ class CalorieTrackerApp:
         self.total_label = tk.Label(
             display_frame, 
             text="Total Calories: 0 kcal", 
-            font=('Arial', 16, 'bold'), 
+            font=FONTS['title'], 
             fg="#E65100",
             bg="#ffffff"
         )
         self.total_label.grid(row=0, column=0, sticky='ew', pady=(0, 10))
 
-        tk.Label(display_frame, text="--- Entries ---", fg="#555555", bg="#ffffff", font=('Arial', 10)).grid(row=1, column=0, sticky='ew', pady=(0, 5))
+        tk.Label(display_frame, text="--- Entries ---", fg="#555555", bg="#ffffff", font=FONTS['small']).grid(row=1, column=0, sticky='ew', pady=(0, 5))
         
         text_scroll_frame = tk.Frame(display_frame)
         text_scroll_frame.grid(row=2, column=0, sticky="nsew")
@@ -596,6 +1035,12 @@ class CalorieTrackerApp:
         scrollbar = tk.Scrollbar(text_scroll_frame)
         scrollbar.grid(row=0, column=1, sticky='ns')
 
+        def on_entries_scroll(first, last):
+            scrollbar.set(first, last)
+            if self.entries_more and not self.entries_load_pending and float(last) >= 1.0:
+                self.entries_load_pending = True
+                self.master.after_idle(self.load_more_entries)
+
         self.entries_text = tk.Text(
             text_scroll_frame, 
             height=12, 
@@ -603,8 +1048,12 @@ class CalorieTrackerApp:
             relief="sunken", 
             wrap="word", 
             bg="#f9f9f9", 
-            font=('Consolas', 10),
-            yscrollcommand=scrollbar.set
+            font=FONTS['mono'],
+            yscrollcommand=on_entries_scroll,
+            # Read-only log rewritten from code; keep Tk from recording an undo history for it
+            undo=False,
+            autoseparators=False,
+            maxundo=0
         )
         self.entries_text.grid(row=0, column=0, sticky='nsew')
         scrollbar.config(command=self.entries_text.yview)
@@ -614,49 +1063,119 @@ class CalorieTrackerApp:
         # Exercise Sidebar
         sidebar_frame = tk.Frame(self.master, padx=10, pady=10, bg="#eaf3ff", relief=tk.RIDGE, bd=2)
         sidebar_frame.grid(row=0, column=1, padx=(0, 10), pady=10, sticky="nsew")
-        recommendations = [
-            ("Walk 30 min", "150 kcal"),
-            ("1 hour Strength Training", "300 kcal"),
-            ("20 min HIIT", "250 kcal"),
-            ("Yoga or Stretching", "80 kcal"),
-            ("Running 5k", "400 kcal"),
-            ("Cycling (Moderate)", "350 kcal")
-        ]
-        sidebar_frame.grid_rowconfigure(len(recommendations)+4, weight=1)
+        sidebar_frame.grid_rowconfigure(5, weight=1)
 
         tk.Label(sidebar_frame, text="🔥 Daily Exercise Goal 🔥", 
-                 font=('Arial', 12, 'bold'), fg="#333333", bg="#eaf3ff").grid(row=0, column=0, sticky='ew', pady=(0, 10))
+                 font=FONTS['section'], fg="#333333", bg="#eaf3ff").grid(row=0, column=0, sticky='ew', pady=(0, 10))
         
-        for i, (name, calories) in enumerate(recommendations):
-            item_frame = tk.Frame(sidebar_frame, bg="#ffffff", padx=10, pady=8, relief=tk.FLAT)
-            item_frame.grid(row=i+1, column=0, sticky='ew', pady=2)
-            tk.Label(item_frame, text=name, font=('Arial', 10, 'bold'), bg="#ffffff", fg="#0056b3").pack(anchor='w')
-            tk.Label(item_frame, text=f"Burn Est.: {calories}", font=('Arial', 9), bg="#ffffff", fg="#666666").pack(anchor='w')
+        # The cards never change, so they are drawn on one canvas instead of a frame and two labels each
+        name_font, burn_font = FONTS['label'], FONTS['caption']
+        name_height = name_font.metrics('linespace')
+        card_height = 16 + name_height + burn_font.metrics('linespace')
+        card_width = 20 + max(max(name_font.measure(name), burn_font.measure(f"Burn Est.: {calories}"))
+                              for name, calories in RECOMMENDATIONS)
+        cards = tk.Canvas(sidebar_frame, width=card_width, height=len(RECOMMENDATIONS) * (card_height + 4),
+                          bg="#eaf3ff", highlightthickness=0)
+        cards.grid(row=1, column=0, sticky='ew')
+        for i, (name, calories) in enumerate(RECOMMENDATIONS):
+            top = i * (card_height + 4) + 2
+            cards.create_rectangle(0, top, card_width, top + card_height, fill="#ffffff", outline="", tags="card")
+            cards.create_text(10, top + 8, text=name, anchor='nw', font=name_font, fill="#0056b3")
+            cards.create_text(10, top + 8 + name_height, text=f"Burn Est.: {calories}", anchor='nw', font=burn_font, fill="#666666")
+
+        def stretch_cards(event):
+            for card in cards.find_withtag("card"):
+                x0, y0, _, y1 = cards.coords(card)
+                cards.coords(card, x0, y0, event.width, y1)
+
+        cards.bind("<Configure>", stretch_cards)
 
         tk.Label(sidebar_frame, text="\nTip: Consistency is key!", 
-                 font=('Arial', 10, 'italic'), fg="#555555", bg="#eaf3ff").grid(row=len(recommendations)+1, column=0, sticky='ew', pady=(10, 0))
+                 font=FONTS['small_italic'], fg="#555555", bg="#eaf3ff").grid(row=2, column=0, sticky='ew', pady=(10, 0))
 
         # History section 
         hist_title = tk.Label(sidebar_frame, text="\n📅 Recent Daily Totals", 
-                             font=('Arial', 12, 'bold'), fg="#333333", bg="#eaf3ff")
-        hist_title.grid(row=len(recommendations)+2, column=0, sticky='ew', pady=(16, 6))
+                             font=FONTS['section'], fg="#333333", bg="#eaf3ff")
+        hist_title.grid(row=3, column=0, sticky='ew', pady=(16, 6))
 
         hist_container = tk.Frame(sidebar_frame, bg="#eaf3ff")
-        hist_container.grid(row=len(recommendations)+3, column=0, sticky="nsew")
+        hist_container.grid(row=4, column=0, sticky="nsew")
         hist_container.grid_rowconfigure(0, weight=1)
         hist_container.grid_columnconfigure(0, weight=1)
 
-        self.history_list = tk.Listbox(hist_container, height=10)
-        self.history_list.grid(row=0, column=0, sticky="nsew")
-
-        def refresh_history():
-            self.history_list.delete(0, tk.END)
-            for row in self.db.load_daily_totals(self.current_user_id, limit=30):
-                marker = " ←" if row['date'] == self.selected_date.isoformat() else ""
-                self.history_list.insert(tk.END, f"{row['date']}: {row['total']} kcal{marker}")
+        # Days are read a page at a time as the list is scrolled, so long histories stay cheap
+        self.history_tree = history_tree = ttk.Treeview(hist_container, columns=("date", "total"), show="headings", height=10)
+        self.history_tree.heading("date", text="Date")
+        self.history_tree.heading("total", text="Total")
+        self.history_tree.column("date", width=90, anchor="w")
+        self.history_tree.column("total", width=80, anchor="e")
+        self.history_tree.tag_configure("current", background="#d0e4ff")
+        self.history_tree.grid(row=0, column=0, sticky="nsew")
+        # Day ordinal -> (total, is selected day) for each row on screen, newest first
+        self.history_rows = {}
+        self.history_more = False
+        # Same guard as entries_load_pending, for the history pager
+        self.history_load_pending = False
+
+        hist_scrollbar = tk.Scrollbar(hist_container)
+        hist_scrollbar.grid(row=0, column=1, sticky='ns')
+
+        def on_history_scroll(first, last):
+            hist_scrollbar.set(first, last)
+            if self.history_more and not self.history_load_pending and float(last) >= 1.0:
+                self.history_load_pending = True
+                self.master.after_idle(self.load_more_history)
+
+        self.history_tree.config(yscrollcommand=on_history_scroll)
+        hist_scrollbar.config(command=self.history_tree.yview)
+
+        def refresh_history(history=None):
+            if history is None:
+                # Reload as many days as are already on screen
+                limit = max(self.HISTORY_PAGE_SIZE, len(self.history_rows))
+                history = self.db.load_daily_totals(self.current_user_id, limit=limit)
+            self.history_more = len(history) >= self.HISTORY_PAGE_SIZE
+            selected_day = self.selected_day
+            rows = {entry_day: (total, entry_day == selected_day) for entry_day, total in history}
+            # Items are keyed by day, so a new day is one insert and a changed total one cell update
+            shown = self.history_rows
+            gone = shown.keys() - rows.keys()
+            if gone:
+                history_tree.delete(*gone)
+            # Bound once; the loop runs for every day on screen
+            insert, set_cell, configure_item = history_tree.insert, history_tree.set, history_tree.item
+            shown_row, fromordinal = shown.get, date.fromordinal
+            for index, (entry_day, (total, current)) in enumerate(rows.items()):
+                old = shown_row(entry_day)
+                if old is None:
+                    insert("", index, iid=entry_day, values=(fromordinal(entry_day).isoformat(), f"{total} kcal"),
+                           tags=("current",) if current else ())
+                    continue
+                if old[0] != total:
+                    set_cell(entry_day, "total", f"{total} kcal")
+                if old[1] != current:
+                    configure_item(entry_day, tags=("current",) if current else ())
+            self.history_rows = rows
 
         self.refresh_history = refresh_history
 
+        self.main_built = True
+        self.bind_user()
+
+    def bind_user(self):
+        self.user_label.config(text=f"User: {self.current_username} | ID: {self.current_user_id}")
+
+        self.calculate_and_display_profile()
+
+        if self.date_picker is not None:
+            self.date_picker.set_date(self.selected_date)
+        else:
+            self.date_label_var.set(self.selected_iso)
+
+        self.meal_var.set("")
+        self.calories_entry.delete(0, tk.END)
+
+        self.cancel_scheduled_update()
         self.update_display()
 
 
@@ -668,44 +1187,156 @@ class CalorieTrackerApp:
             messagebox.showerror("Input Error", "Please fill in both the meal and calorie fields.")
             return
 
-        try:
-            calories = int(calories_str)
-            if calories <= 0:
-                messagebox.showerror("Input Error", "Calories must be a positive whole number.")
-                return
-        except ValueError:
+        if not CALORIES_PATTERN.fullmatch(calories_str):
             messagebox.showerror("Input Error", "Calories must be a positive whole number.")
             return
+        calories = int(calories_str)
 
-        self.db.save_entry(self.current_user_id, meal, calories, self.selected_date.isoformat())
+        # Bring a pending day switch on screen first so the new line lands on the right day
+        if self.refresh_job is not None:
+            self.cancel_scheduled_update()
+            self.update_display()
+
+        self.db.save_entry(self.current_user_id, meal, calories, self.selected_day)
 
         self.meal_var.set("")
         self.calories_entry.delete(0, tk.END)
 
+        # Append to the cached day instead of reloading and re-rendering every entry
+        self.running_total += calories
+        self.update_total_label()
+        self.displayed_state = (self.current_user_id, self.selected_day, self.db.entries_generation)
+
+        # With pages still unread, the new row shows up when scrolling reaches it
+        if not self.entries_more:
+            self.entries_cache.append(EntryRow(None, meal, calories))
+            self.entries_text.config(state=tk.NORMAL)
+            if len(self.entries_cache) == 1:
+                self.entries_text.delete(1.0, tk.END)
+            self.entries_text.insert(tk.END, f"{meal}: {calories} kcal\n")
+            self.entries_text.config(state=tk.DISABLED)
+
+        self.schedule_flush()
+
+    def schedule_flush(self):
+        # A burst of adds shares one commit and one history/calendar refresh once input goes idle
+        if self.flush_job is not None:
+            self.master.after_cancel(self.flush_job)
+        self.flush_job = self.master.after(500, self.flush_entries_when_idle)
+
+    def flush_entries_when_idle(self):
+        self.wait_for_write(self.db.flush_entries())
+
+    def wait_for_write(self, write):
+        # Poll the writer instead of blocking on it, so the commit's fsync never stalls the
+        # event loop; the history is only re-read once the new rows are on disk
+        if write is not None and not write.done():
+            self.flush_job = self.master.after(20, self.wait_for_write, write)
+            return
+        self.flush_job = None
+        error = self.db.take_write_error()
+        if write is not None and write.exception() is not None:
+            error = write.exception()
+        if isinstance(error, sqlite3.OperationalError):
+            # The rows are back in the buffer; re-submit them to the writer later
+            # rather than retrying here and blocking Tk on the busy timeout
+            if not self.write_retrying:
+                messagebox.showwarning("Save Delayed", f"Entries could not be saved yet and will be retried: {error}")
+            self.write_retrying = True
+            self.flush_job = self.master.after(self.WRITE_RETRY_MS, self.flush_entries_when_idle)
+            return
+        self.write_retrying = False
+        if error is not None:
+            messagebox.showerror("Save Error", f"Some entries could not be saved: {error}")
+            # Re-read everything from disk so the totals only count rows that were written
+            self.db.discard_cached_results()
+            self.displayed_state = None
+            self.update_display()
+            return
+        self.refresh_history()
+        self.highlight_tracked_dates()
+
+    def flush_pending_entries(self):
+        if self.flush_job is not None:
+            self.master.after_cancel(self.flush_job)
+            self.flush_job = None
+        self.db.flush_entries(wait=True)
+
+    def load_more_entries(self):
+        self.entries_load_pending = False
+        if not self.entries_more:
+            return
+        rows = self.db.load_entries(self.current_user_id, self.selected_day, self.ENTRY_PAGE_SIZE, after_id=self.entries_last_id)
+        self.entries_more = len(rows) == self.ENTRY_PAGE_SIZE
+        if not rows:
+            return
+        self.entries_last_id = rows[-1].id
+        self.entries_cache.extend(rows)
+
+        self.entries_text.config(state=tk.NORMAL)
+        self.entries_text.insert(tk.END, "".join(f"{entry.meal}: {entry.calories} kcal\n" for entry in rows))
+        self.entries_text.config(state=tk.DISABLED)
+
+    def schedule_update(self):
+        # Rapid Prev/Next clicks collapse into a single reload once they pause
+        self.cancel_scheduled_update()
+        self.refresh_job = self.master.after(30, self.run_scheduled_update)
+
+    def cancel_scheduled_update(self):
+        if self.refresh_job is not None:
+            self.master.after_cancel(self.refresh_job)
+            self.refresh_job = None
+
+    def run_scheduled_update(self):
+        self.refresh_job = None
         self.update_display()
 
+    def load_more_history(self):
+        self.history_load_pending = False
+        if not self.history_more or not self.history_rows:
+            return
+        page = self.db.load_daily_totals(self.current_user_id, self.HISTORY_PAGE_SIZE, before_day=min(self.history_rows))
+        self.refresh_history([(entry_day, total) for entry_day, (total, _) in self.history_rows.items()] + page)
+        self.history_more = len(page) == self.HISTORY_PAGE_SIZE
+
+    def update_total_label(self):
+        self.total_label.config(text=f"Total Calories on {self.selected_pretty}: {self.running_total} kcal")
+
     def update_display(self):
-        current_entries = self.db.load_entries(self.current_user_id, self.selected_date.isoformat())
-        
-        total = sum(entry['calories'] for entry in current_entries)
-        self.total_label.config(text=f"Total Calories on {self.selected_date.strftime('%b %d, %Y')}: {total} kcal")
+        entry_day = self.selected_day
+        state = (self.current_user_id, entry_day, self.db.entries_generation)
+        if state == self.displayed_state:
+            return
+
+        # Keep every history page already scrolled in, as refresh_history() does
+        history_limit = max(self.HISTORY_PAGE_SIZE, len(self.history_rows))
+        (self.running_total, entry_count), rows, history, tracked_dates = self.db.load_day_and_history(
+            self.current_user_id, entry_day, self.ENTRY_PAGE_SIZE, history_limit)
+        # Only marked as shown once the load succeeded, so a failed read is retried next time
+        self.displayed_state = state
+        # A copy, since the cached page must not grow when entries are appended here
+        self.entries_cache = list(rows)
+        self.entries_last_id = rows[-1].id if rows else 0
+        self.entries_more = len(rows) < entry_count
+        current_entries = self.entries_cache
+        self.update_total_label()
 
         self.entries_text.config(state=tk.NORMAL)
         self.entries_text.delete(1.0, tk.END)
         
         if not current_entries:
-            self.entries_text.insert(tk.END, f"No entries tracked for {self.selected_date.strftime('%A')}. Add a meal above!")
+            self.entries_text.insert(tk.END, self.selected_empty_text)
         else:
-            for entry in current_entries:
-                line = f"{entry['meal']}: {entry['calories']} kcal\n"
-                self.entries_text.insert(tk.END, line)
+            # One Tcl call for the whole day rather than one per entry
+            lines = [f"{entry.meal}: {entry.calories} kcal\n" for entry in current_entries]
+            self.entries_text.insert(tk.END, "".join(lines))
                 
         self.entries_text.config(state=tk.DISABLED)
 
         if hasattr(self, "refresh_history"):
-            self.refresh_history()
+            self.refresh_history(history)
 
-        self.highlight_tracked_dates() 
+        self.highlight_tracked_dates(tracked_dates) 
         
 # Run Application
 if __name__ == '__main__':